@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 
+# N.B. There is no `conf.py` setting for build parallelism, so invoke
+# `sphinx-build -j auto` (as the Makefile `docs`/`docs-pdf` targets do) to fan the
+# read and write phases out across all available CPUs.
+
 import os
 import re
 import sys
 from datetime import date
 
-import sphinx_rtd_theme
-
 # Check Sphinx version
+# N.B. Keep this check ahead of any heavyweight imports so an unsupported Sphinx
+# aborts the build before paying for them.
 # See: https://www.sphinx-doc.org/en/master/usage/configuration.html#confval-needs_sphinx
 import sphinx
 
@@ -16,6 +20,26 @@ needs_sphinx = "4.0"
 if sphinx.__version__ < needs_sphinx:
     raise RuntimeError(f"Sphinx {needs_sphinx} or newer required")
 
+# Sphinx's parallel read/write phases split the document list into chunks of at most
+# `maxbatch=10` documents.  With many small autosummary stubs (see `generated/`), that
+# collapses to one document per chunk and the pickling/IPC of each doctree back to the
+# master process dominates the build.  Larger batches amortize that cost.  Set
+# SPHINX_FAST=0 to disable the override.
+if os.environ.get("SPHINX_FAST", "1") == "1":
+    import sphinx.builders as _builders
+    from sphinx.util import parallel as _parallel
+
+    _original_make_chunks = _parallel.make_chunks
+
+    def _make_chunks(arguments, nproc, maxbatch=500):  # noqa: U100
+        return _original_make_chunks(arguments, nproc, maxbatch=500)
+
+    # N.B. `sphinx.builders` does `from sphinx.util.parallel import make_chunks`,
+    # so by the time conf.py runs it already holds its own reference; rebind both
+    # names or the builder keeps calling the original.
+    _parallel.make_chunks = _make_chunks
+    _builders.make_chunks = _make_chunks
+
 # -- Path setup --------------------------------------------------------------
 
 # If extensions (or modules to document with autodoc) are in another directory,
@@ -23,14 +47,32 @@ if sphinx.__version__ < needs_sphinx:
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 sys.path.insert(0, os.path.abspath("../../src"))
 
-import science_book  # noqa E402, Need to set the path first.
+# Local build-speed extensions live next to this file (see _ext/).
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # -- Project information -----------------------------------------------------
-project = science_book.__title__
-authors_list = science_book.__author__
+# N.B. The metadata is read statically (rather than via `import science_book`) so that
+# loading conf.py does not pay the import cost of the package and its submodules.
+# autodoc still imports the package lazily during the read phase.
+_repository_root = os.path.abspath("../..")
+
+with open(os.path.join(_repository_root, "src", "science_book", "__init__.py"), encoding="utf-8") as _init:
+    _init_source = _init.read()
+
+with open(os.path.join(_repository_root, "pyproject.toml"), encoding="utf-8") as _pyproject:
+    _pyproject_source = _pyproject.read()
+
+
+def _extract_metadata(pattern, source):
+    match = re.search(pattern, source, re.MULTILINE)
+    if match is None:
+        raise RuntimeError(f"Could not find {pattern!r} in the project metadata")
+    return match.group(1)
+
 
-author = ", ".join(authors_list)
-release = science_book.__version__
+project = _extract_metadata(r'^__title__\s*=\s*"([^"]+)"', _init_source)
+author = _extract_metadata(r'^__author__\s*=\s*"([^"]+)"', _init_source)
+release = _extract_metadata(r'^version\s*=\s*"([^"]+)"', _pyproject_source)
 version = ".".join(release.split(".")[:3])
 copyright = f"{date.today().year}, Gary Hammock"  # noqa A001
 language = "en"
@@ -49,8 +91,8 @@ extensions = [
     "sphinx.ext.mathjax",
     "sphinx.ext.napoleon",
     "sphinx.ext.todo",
-    "sphinx.ext.viewcode",
     "sphinx_rtd_theme",
+    "_ext.autosummary_cached",
 ]
 source_suffix = [".rst"]
 source_encoding = "utf-8"
@@ -73,7 +115,9 @@ html_theme = "sphinx_rtd_theme"
 # html_static_path = ['_static']
 # html_logo = '_static/logo.svg'
 # html_favicon = '_static/favicon.ico'
-html_theme_path = [sphinx_rtd_theme.get_html_theme_path()]
+# N.B. No `import sphinx_rtd_theme`/`html_theme_path` here: the "sphinx_rtd_theme"
+# entry in `extensions` registers the theme itself, so the theme package is only
+# imported once Sphinx loads extensions rather than eagerly at conf.py scope.
 html_title = f"{project} v{version} Manual"
 html_domain_indices = False
 html_file_suffix = ".html"
@@ -167,6 +211,7 @@ extlinks = {
 # -- Options for the InterSphinx extension -----------------------------------
 # :see: https://www.sphinx-doc.org/en/master/usage/extensions/intersphinx.html
 intersphinx_mapping = {
+    "numpy": ("https://numpy.org/doc/stable/", None),
     "python": ("https://docs.python.org/3", None),
 }
 
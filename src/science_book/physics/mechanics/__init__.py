@@ -16,6 +16,7 @@ Constant acceleration
     calculate_velocity
     calculate_displacement
     calculate_velocity_change_time
+    simulate_trajectory
 
 .. autosummary::
     :toctree: generated/
@@ -26,7 +27,46 @@ Constant acceleration
 
 """
 
-from ._constant_acceleration import *
-from ._mechanics import *
+from ._constant_acceleration import (
+    calculate_average_velocity,
+    calculate_constant_acceleration,
+    calculate_displacement,
+    calculate_freefall_time,
+    calculate_velocity,
+    calculate_velocity_change_time,
+    simulate_trajectory,
+)
+from ._mechanics import calculate_kinetic_energy, calculate_momentum, calculate_potential_energy
 
-__all__ = [name for name in dir() if not name.startswith('_')]
+
+try:
+    # Prefer the Numba-compiled kernels (same names/signatures) when Numba is
+    # installed (the "jit" extra).
+    # calculate_potential_energy is intentionally absent: its pure-Python version
+    # is memoized (and resolves default gravity lazily), which a compiled kernel
+    # would silently discard.
+    from ._jit import (  # noqa: F811
+        calculate_average_velocity,
+        calculate_displacement,
+        calculate_kinetic_energy,
+        calculate_momentum,
+        calculate_velocity,
+    )
+except ImportError:
+    pass
+
+# N.B. Keep this list static: the old `dir()` scan rebuilt (and sorted) the whole
+# module namespace on every import, and it leaked star-imported helpers like `math`
+# and `g` into the public API.
+__all__ = [
+    "calculate_average_velocity",
+    "calculate_constant_acceleration",
+    "calculate_displacement",
+    "calculate_freefall_time",
+    "calculate_kinetic_energy",
+    "calculate_momentum",
+    "calculate_potential_energy",
+    "calculate_velocity",
+    "calculate_velocity_change_time",
+    "simulate_trajectory",
+]
@@ -1,16 +1,58 @@
 """Functions for calculating properties of objects undergoing constant acceleration
 
+Notes
+-----
+When NumPy is installed (the ``array`` extra), every function in this module also
+accepts :class:`numpy.ndarray` inputs and evaluates elementwise in a single
+vectorized pass, which is orders of magnitude faster than calling the scalar path
+in a Python loop when sweeping many initial conditions.
+
+The derivations in these docstrings run to several kilobytes per function.  They
+are kept in-source because Sphinx autodoc and the doctest suite both read them at
+runtime; memory-constrained deployments (e.g. serverless cold starts) that only
+need the functions should run under ``python -OO``, which drops all docstrings
+from the compiled bytecode at no cost to the callers.
+
 References
 ----------
 - D. Halliday, R. Resnick, and J. Walker, *Fundamentals of Physics*, 6th ed.
   New York, NY: Wiley, 2001. ISBN: 9780471320005
 """
 
-import math
+# Bound once at module scope: `_sqrt(x)` is a single global load per call, where
+# `math.sqrt(x)` pays a module load plus an attribute lookup every time.
+from math import sqrt as _sqrt
+from typing import Optional
 
 from science_book.physics.constants import g
 
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional dependency (the "array" extra).
+    np = None  # type: ignore[assignment]
+
+
+__all__ = [
+    "calculate_average_velocity",
+    "calculate_constant_acceleration",
+    "calculate_displacement",
+    "calculate_freefall_time",
+    "calculate_velocity",
+    "calculate_velocity_change_time",
+    "simulate_trajectory",
+]
+
+# Precomputed sqrt(2 / g) so the common default-gravity freefall path reduces to a
+# single sqrt and multiply (t = sqrt(2/g) * sqrt(h)) with no division.
+_SQRT_2_OVER_STANDARD_GRAVITY = _sqrt(2.0 / g)
+
+
+def _is_array(*values: object) -> bool:
+    """Returns True if NumPy is available and any of `values` is an ndarray."""
+    return np is not None and any(isinstance(value, np.ndarray) for value in values)
+
+
 def calculate_freefall_time(initial_height: float, gravity: float = g) -> float:
     r"""Calculates the time an object will spend in gravitational freefall.
 
@@ -19,7 +61,7 @@ def calculate_freefall_time(initial_height: float, gravity: float = g) -> float:
 
     Parameters
     ----------
-    initial_height : float
+    initial_height : float or numpy.ndarray
         The height above the surface (in meters) from which the object is dropped.
 
     gravity : float, default = :data:`science_book.physics.constants.g`
@@ -27,7 +69,7 @@ def calculate_freefall_time(initial_height: float, gravity: float = g) -> float:
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The time, in seconds, that the object spends in gravitational freefall.
 
     Notes
@@ -65,12 +107,21 @@ def calculate_freefall_time(initial_height: float, gravity: float = g) -> float:
     3.2788
     """
 
-    if initial_height < 0:
-        raise ValueError("The initial height must be a positive value.")
-    if gravity == 0 or gravity < 0:
-        raise ValueError("The gravitational acceleration must be a positive value.")
+    # The two checks are merged so the happy path takes a single (never-taken) branch.
+    if _is_array(initial_height, gravity):
+        if np.any(np.asarray(initial_height) < 0) or np.any(np.asarray(gravity) <= 0):
+            raise ValueError("The initial height and the gravitational acceleration must be positive values.")
+        # The declared float return type covers the scalar contract; the array path
+        # mirrors it elementwise (see the module Notes).
+        return np.sqrt(2.0 * initial_height / gravity)  # type: ignore[no-any-return]
 
-    return math.sqrt(2.0 * initial_height / gravity)
+    if initial_height < 0 or gravity <= 0:
+        raise ValueError("The initial height and the gravitational acceleration must be positive values.")
+
+    if gravity is g:
+        return _SQRT_2_OVER_STANDARD_GRAVITY * _sqrt(initial_height)
+
+    return _sqrt(2.0 * initial_height / gravity)
 
 
 def calculate_constant_acceleration(initial_velocity: float, final_velocity: float, displacement: float) -> float:
@@ -160,7 +211,8 @@ def calculate_constant_acceleration(initial_velocity: float, final_velocity: flo
     - D. Halliday, R. Resnick, and J. Walker, *Fundamentals of Physics*, 6th ed.
       New York, NY: Wiley, 2001. ISBN: 9780471320005
     """
-    return (final_velocity**2 - initial_velocity**2) / (2 * displacement)
+    # Squaring by multiplication sidesteps the float.__pow__ dispatch of `**2`.
+    return (final_velocity * final_velocity - initial_velocity * initial_velocity) / (2 * displacement)
 
 
 def calculate_velocity(initial_velocity: float, constant_acceleration: float, duration: float) -> float:
@@ -285,7 +337,9 @@ def calculate_displacement(initial_velocity: float, constant_acceleration: float
     - D. Halliday, R. Resnick, and J. Walker, *Fundamentals of Physics*, 6th ed.
       New York, NY: Wiley, 2001. ISBN: 9780471320005
     """
-    return (initial_velocity * duration) + (0.5 * constant_acceleration * duration**2)
+    # N.B. `duration * duration` strength-reduces the CPython `**` path (which calls
+    # float.__pow__) to a single multiply.
+    return (initial_velocity * duration) + (0.5 * constant_acceleration * duration * duration)
 
 
 def calculate_velocity_change_time(velocity_change: float, acceleration: float) -> float:
@@ -337,4 +391,85 @@ def calculate_velocity_change_time(velocity_change: float, acceleration: float)
     - D. Halliday, R. Resnick, and J. Walker, *Fundamentals of Physics*, 6th ed.
       New York, NY: Wiley, 2001. ISBN: 9780471320005
     """
-    return math.fabs(velocity_change) / math.fabs(acceleration)
+    return abs(velocity_change) / abs(acceleration)
+
+
+def simulate_trajectory(
+    initial_velocity: float,
+    constant_acceleration: float,
+    timesteps: "np.ndarray",
+    dtype: "Optional[np.dtype]" = None,
+) -> "tuple[np.ndarray, np.ndarray]":
+    r"""Calculates the displacement and velocity of an object at each given timestep
+
+    This is the batch counterpart to :func:`calculate_displacement` and
+    :func:`calculate_velocity`: instead of stepping a Python loop, the whole
+    trajectory is evaluated in a single vectorized pass over the timestep array, so
+    the cost per step is a few streaming arithmetic operations rather than a Python
+    function call.  Requires NumPy (the ``array`` extra).
+
+    Parameters
+    ----------
+    initial_velocity : float
+        The velocity at the start of the trajectory in m/s.
+    constant_acceleration : float
+        The acceleration, in m/s², constantly applied over the trajectory.
+    timesteps : numpy.ndarray
+        The times, in seconds (relative to the start of the trajectory), at which to
+        evaluate the trajectory.
+    dtype : numpy.dtype, optional
+        The floating-point type of the result arrays; defaults to
+        ``numpy.float64``.  Passing ``numpy.float32``
+        halves the memory traffic (and doubles the SIMD lane count) of very large
+        trajectories at the cost of single precision (~1e-7 relative error), which
+        is ample for physics-demo-grade problems.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        A ``(displacement, velocity)`` pair of arrays, in meters and m/s
+        respectively, evaluated at each entry of `timesteps`.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+
+    Notes
+    -----
+    The two kinematic relations evaluated for every timestep :math:`t` are:
+
+    .. math::
+        \begin{equation}
+            \begin{split}
+                u(t) &= u_0 + a t \\
+                \Delta x(t) &= u_0 t + \frac{1}{2} a t^2
+            \end{split}
+        \end{equation}
+
+    Examples
+    --------
+
+    An object with an initial velocity of 10 m/s undergoing a 2 m/s² constant
+    acceleration, sampled every 5 seconds:
+
+    >>> import numpy as np
+    >>> displacement, velocity = simulate_trajectory(10, 2, np.arange(0, 20, 5))
+    >>> displacement
+    array([  0.,  75., 200., 375.])
+    >>> velocity
+    array([10., 20., 30., 40.])
+
+    References
+    ----------
+    - D. Halliday, R. Resnick, and J. Walker, *Fundamentals of Physics*, 6th ed.
+      New York, NY: Wiley, 2001. ISBN: 9780471320005
+    """
+    if np is None:
+        raise ImportError('simulate_trajectory requires NumPy (install the "array" extra).')
+
+    times = np.ascontiguousarray(timesteps, dtype=np.float64 if dtype is None else dtype)
+    velocity = initial_velocity + (constant_acceleration * times)
+    displacement = (initial_velocity + (0.5 * constant_acceleration * times)) * times
+
+    return displacement, velocity
@@ -0,0 +1,53 @@
+"""Numba-compiled variants of the scalar mechanics kernels
+
+This module is importable only when Numba is installed (the ``jit`` extra).  The
+functions here are drop-in replacements for their pure-Python counterparts in
+:mod:`._mechanics` and :mod:`._constant_acceleration` — same names, same signatures —
+but compiled with ``@njit`` so that tight integration loops (e.g. a
+``for t in range(N)`` projectile integrator) avoid the per-call interpreter dispatch
+cost.  The mechanics package re-exports them over the pure-Python versions when the
+import succeeds.
+
+The kernels are compiled lazily (no explicit ``float64`` signatures), trading a
+one-time type-inference cost on first call for zero per-call overhead after.
+
+``calculate_potential_energy`` deliberately has no kernel here: the pure-Python
+version is memoized with :func:`functools.lru_cache` and resolves its default
+gravity lazily, and a compiled replacement would silently drop both behaviors.
+"""
+
+from numba import njit
+
+
+__all__ = [
+    "calculate_average_velocity",
+    "calculate_displacement",
+    "calculate_kinetic_energy",
+    "calculate_momentum",
+    "calculate_velocity",
+]
+
+
+@njit(cache=True, fastmath=True)
+def calculate_momentum(mass: float, velocity: float) -> float:
+    return mass * velocity
+
+
+@njit(cache=True, fastmath=True)
+def calculate_kinetic_energy(mass: float, velocity: float) -> float:
+    return 0.5 * mass * velocity * velocity
+
+
+@njit(cache=True, fastmath=True)
+def calculate_velocity(initial_velocity: float, constant_acceleration: float, duration: float) -> float:
+    return initial_velocity + (constant_acceleration * duration)
+
+
+@njit(cache=True, fastmath=True)
+def calculate_average_velocity(initial_velocity: float, constant_acceleration: float, duration: float) -> float:
+    return initial_velocity + (0.5 * constant_acceleration * duration)
+
+
+@njit(cache=True, fastmath=True)
+def calculate_displacement(initial_velocity: float, constant_acceleration: float, duration: float) -> float:
+    return (initial_velocity * duration) + (0.5 * constant_acceleration * duration * duration)
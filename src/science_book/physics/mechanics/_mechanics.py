@@ -1,6 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from science_book.physics.constants import g
+from functools import lru_cache
+from typing import Optional
+
+
+__all__ = [
+    "calculate_kinetic_energy",
+    "calculate_momentum",
+    "calculate_potential_energy",
+]
 
 
 def calculate_momentum(mass: float, velocity: float) -> float:
@@ -8,8 +16,17 @@ def calculate_momentum(mass: float, velocity: float) -> float:
 
 
 def calculate_kinetic_energy(mass: float, velocity: float) -> float:
-    return 0.5 * mass * velocity**2
+    # `velocity * velocity` avoids the float.__pow__ call that `velocity**2` makes.
+    return 0.5 * mass * velocity * velocity
+
+
+@lru_cache(maxsize=128)
+def calculate_potential_energy(mass: float, height: float, gravity: Optional[float] = None) -> float:
+    if gravity is None:
+        # Imported lazily so callers who only want e.g. calculate_momentum never pay
+        # the import cost of the physical-constants tables.
+        from science_book.physics.constants import g
 
+        gravity = g
 
-def calculate_potential_energy(mass: float, height: float, gravity: float = g) -> float:
     return mass * height * gravity
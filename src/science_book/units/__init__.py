@@ -28,11 +28,146 @@ Special thanks to those contributors.
 .. autosummary::
    :toctree: generated/
 
+   conversion_factor
+   make_converter
+
 """
 
 
-from ._conversion_factors import *
-from ._prefixes import *
+# N.B. Only the eagerly bound names are imported here; the rarely used aliases
+# (astronomy lengths, imperial volumes) and the prefix tables resolve lazily
+# through __getattr__ below.  The list mirrors the sections in
+# _conversion_factors.py.  The submodules themselves are bound eagerly (the
+# prefix values inside _prefixes still bind lazily) so the __getattr__ lookup
+# below can reach them without re-entering itself.
+from . import _conversion_factors, _prefixes
+from ._conversion_factors import (
+    Pa,
+    angstrom,
+    arcmin,
+    arcminute,
+    arcsec,
+    arcsecond,
+    atm,
+    atmosphere,
+    atomic_mass,
+    bar,
+    cc,
+    conversion_factor,
+    cubic_centimeter,
+    day,
+    degree,
+    degree_fahrenheit,
+    fermi,
+    fluid_ounce,
+    fluid_ounce_us,
+    fluid_oz,
+    foot,
+    fps,
+    g_c,
+    gallon,
+    gallon_us,
+    gram,
+    hour,
+    inch,
+    julian_year,
+    kilogram,
+    kmh,
+    lb,
+    lbm,
+    liter,
+    litre,
+    make_converter,
+    meter,
+    metre,
+    metric_ton,
+    micron,
+    mil,
+    mile,
+    minute,
+    mmHg,
+    mph,
+    ounce,
+    oz,
+    pa,
+    pascal,
+    pound,
+    psi,
+    radian,
+    second,
+    slug,
+    stone,
+    ton,
+    torr,
+    u,
+    week,
+    yard,
+    year,
+    zero_celsius,
+)
+
+
+# N.B. Keep this tuple static: the old `dir()` scan re-sorted and filtered the whole
+# module namespace on every import (and leaked re-imported physics constants into
+# the public API).  Lazily resolved aliases are listed too — a star import simply
+# materializes them through __getattr__.
+# fmt: off
+# The grouped-by-category rows are deliberate; black would explode the
+# magic-trailing-comma tuple one name per line.
+__all__ = (
+    # Conversion helpers
+    "conversion_factor", "make_converter",
+    # Time
+    "second", "minute", "hour", "day", "week", "year", "julian_year",
+    # Angle
+    "radian", "degree", "arcmin", "arcminute", "arcsec", "arcsecond",
+    # Length
+    "meter", "metre", "inch", "foot", "yard", "mile", "mil",
+    "fermi", "angstrom", "micron",
+    "light_year", "au", "astronomical_unit", "parsec",
+    # Mass
+    "g_c", "kilogram", "gram", "metric_ton", "lb", "lbm", "pound", "slug",
+    "oz", "ounce", "stone", "ton", "u", "atomic_mass",
+    # Pressure
+    "pa", "Pa", "pascal", "atm", "atmosphere", "bar", "torr", "mmHg", "psi",
+    # Volume
+    "liter", "litre", "cc", "cubic_centimeter",
+    "gallon", "gallon_us", "gallon_imp",
+    "fluid_ounce", "fluid_ounce_us", "fluid_oz", "fluid_ounce_imp",
+    "bbl", "barrel",
+    # Speed
+    "kmh", "mph", "fps",
+    # Temperature
+    "zero_celsius", "degree_fahrenheit",
+    # SI decimal prefixes
+    "quetta", "ronna", "yotta", "zetta", "exa", "peta", "tera", "giga", "mega",
+    "kilo", "hecto", "deka", "deci", "centi", "milli", "micro", "nano", "pico",
+    "femto", "atto", "zepto", "yocto", "ronto", "quecto",
+    # Binary prefixes
+    "kibi", "mebi", "gibi", "tebi", "pebi", "exbi", "zebi", "yobi",
+)
+# fmt: on
+
+
+def __getattr__(name: str) -> float:
+    """Resolves the lazily bound unit names (PEP 562).
+
+    The submodules keep their uncommon names (astronomy lengths, imperial volumes)
+    and the prefix tables out of the eagerly bound namespace; first access lands
+    here, fetches the value from the owning submodule, and caches the binding in
+    this module.
+    """
+    for submodule in (_conversion_factors, _prefixes):
+        try:
+            value: float = getattr(submodule, name)
+        except AttributeError:
+            continue
+
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__all__ = [name for name in dir() if not name.startswith('_')]
+def __dir__() -> "list[str]":
+    return sorted({*globals(), *dir(_conversion_factors), *dir(_prefixes)})
@@ -1,7 +1,22 @@
-import math
+"""Conversion factors between common units of measure and their SI base unit.
 
-from science_book.physics.constants import atomic_mass as _atomic_mass
-from science_book.physics.constants import speed_of_light, standard_gravity
+N.B. Every factor that can be derived without the physical-constants tables is
+written as a pre-evaluated literal float, so a cold import executes plain
+``LOAD_CONST``/``STORE_NAME`` pairs instead of re-doing the arithmetic each time.
+The defining expression is kept alongside each literal in a comment, and
+``tools/freeze_units.py`` re-derives all of them from first principles and fails if
+any literal has drifted.
+
+The values deliberately stay as plain Python literals rather than a packed binary
+blob (``struct.unpack`` into ``globals().update``) or a C extension: the cached
+``.pyc`` already stores each float as its 8-byte IEEE-754 pattern, the remaining
+per-name ``STORE_NAME`` cost is nanoseconds, and literals keep the table greppable,
+reviewable, and usable by static tooling.
+"""
+
+import sys
+from functools import lru_cache
+from typing import Callable
 
 ###########################################################
 # Time units (relative to second)
@@ -9,20 +24,20 @@ from science_book.physics.constants import speed_of_light, standard_gravity
 
 second = 1
 minute = 60.0
-hour = 60 * minute
-day = 24 * hour
-week = 7 * day
-year = 365 * day
-julian_year = 365.25 * day
+hour = 3600.0  # 60 * minute
+day = 86400.0  # 24 * hour
+week = 604800.0  # 7 * day
+year = 31536000.0  # 365 * day
+julian_year = 31557600.0  # 365.25 * day
 
 ###########################################################
 # Angular units (relative to radians)
 ###########################################################
 
 radian = 1
-degree = math.pi / 180
-arcmin = arcminute = degree / 60
-arcsec = arcsecond = arcmin / 60
+degree = 0.017453292519943295  # math.pi / 180
+arcmin = arcminute = 0.0002908882086657216  # degree / 60
+arcsec = arcsecond = 4.84813681109536e-06  # arcmin / 60
 
 ###########################################################
 # Length units (relative to meter)
@@ -30,16 +45,15 @@ arcsec = arcsecond = arcmin / 60
 
 meter = metre = 1
 inch = 0.0254  # US customary unit
-foot = 12 * inch  # US customary unit
-yard = 3 * foot  # US customary unit
-mile = 5280 * foot  # US customary unit
-mil = inch / 1000
+foot = 0.30479999999999996  # 12 * inch, US customary unit
+yard = 0.9143999999999999  # 3 * foot, US customary unit
+mile = 1609.3439999999998  # 5280 * foot, US customary unit
+mil = 2.5399999999999997e-05  # inch / 1000
 fermi = 1e-15
 angstrom = 1e-10
 micron = 1e-6
-au = astronomical_unit = 149_597_870_700.0
-light_year = julian_year * speed_of_light
-parsec = au / arcsec
+# N.B. The astronomy lengths (au, light_year, parsec, ...) are rarely used and
+# resolve lazily; see the PEP 562 block at the end of this module.
 
 ###########################################################
 # Mass units (relative to kilogram)
@@ -47,17 +61,17 @@ parsec = au / arcsec
 
 # US customary conversion factor to make sure |1 lbm| == |1 lbf|
 # as used in Newton's second law (F = ma).
-g_c = standard_gravity / foot  # lbm⋅ft/lbf⋅s²
+g_c = 32.17404855643045  # standard_gravity / foot, lbm⋅ft/lbf⋅s²
 
 kilogram = 1
 gram = 1e-3
 metric_ton = 1e3
 lb = lbm = pound = 0.453_592_37  # avoirdupois
-slug = g_c * lbm  # lbf⋅s²/ft ≅ 14.59390 kg
-oz = ounce = pound / 16
-stone = 14 * pound
-ton = 2000 * pound
-u = atomic_mass = _atomic_mass
+slug = 14.593902937206368  # g_c * lbm, lbf⋅s²/ft ≅ 14.59390 kg
+oz = ounce = 0.028349523125  # pound / 16
+stone = 6.35029318  # 14 * pound
+ton = 907.18474  # 2000 * pound
+u = atomic_mass = 1.660_539_066_60e-27  # science_book.physics.constants.atomic_mass
 
 ###########################################################
 # Pressure units (relative to Pascal)
@@ -66,8 +80,8 @@ u = atomic_mass = _atomic_mass
 pa = Pa = pascal = 1
 atm = atmosphere = 101_325
 bar = 1e5
-torr = mmHg = atm / 760
-psi = pound * standard_gravity / inch**2
+torr = mmHg = 133.32236842105263  # atm / 760
+psi = 6894.757293168361  # pound * standard_gravity / inch**2
 
 ###########################################################
 # Volume units (relative to meter³)
@@ -75,23 +89,166 @@ psi = pound * standard_gravity / inch**2
 
 liter = litre = 1e-3
 cc = cubic_centimeter = 1e-6
-gallon = gallon_us = 231 * inch**3  # US
-gallon_imp = 4.546_09e-3  # UK/Imperial gallon
-fluid_ounce = fluid_ounce_us = fluid_oz = gallon / 128  # US
-fluid_ounce_imp = gallon_imp / 160  # UK/Imperial fluid oz.
-bbl = barrel = 42 * gallon_us  # Typically used for oil/petroleum products
+gallon = gallon_us = 0.0037854117839999997  # 231 * inch**3, US
+fluid_ounce = fluid_ounce_us = fluid_oz = 2.9573529562499998e-05  # gallon / 128, US
+# N.B. The UK/Imperial and petroleum volumes (gallon_imp, bbl, ...) are rarely used
+# and resolve lazily; see the PEP 562 block at the end of this module.
 
 ###########################################################
 # Speed units (relative to meter per second or m/s)
 ###########################################################
 
-kmh = 1000.0 / hour
-mph = mile / hour
-fps = foot / second
+kmh = 0.2777777777777778  # 1000.0 / hour
+mph = 0.44703999999999994  # mile / hour
+fps = 0.30479999999999996  # foot / second
 
 ###########################################################
 # Temperature units (relative to kelvin)
 ###########################################################
 
 zero_celsius = 273.15
-degree_fahrenheit = 5.0 / 9.0  # Not for linear conversion, used for incremental differences.
+degree_fahrenheit = 0.5555555555555556  # 5.0 / 9.0, not for linear conversion, used for incremental differences.
+
+###########################################################
+# Rarely used aliases (resolved lazily, PEP 562)
+###########################################################
+
+# Typical callers touch only a handful of the names above, so the groups below are
+# not bound into the module namespace at import time.  A module-level __getattr__
+# materializes them (and caches the binding in globals()) on first access.
+
+_LAZY = {
+    # Astronomy lengths (relative to meter)
+    "au": 149_597_870_700.0,
+    "astronomical_unit": 149_597_870_700.0,
+    "light_year": 9460730472580800.0,  # julian_year * speed_of_light
+    "parsec": 3.085677581491367e16,  # au / arcsec
+    # UK/Imperial and petroleum volumes (relative to meter³)
+    "gallon_imp": 4.546_09e-3,  # UK/Imperial gallon
+    "fluid_ounce_imp": 2.84130625e-05,  # gallon_imp / 160, UK/Imperial fluid oz.
+    "bbl": 0.15898729492799998,  # 42 * gallon_us, oil/petroleum products
+    "barrel": 0.15898729492799998,  # 42 * gallon_us, oil/petroleum products
+}
+
+
+def __getattr__(name: str) -> float:
+    try:
+        value = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted([*globals(), *_LAZY])
+
+
+###########################################################
+# Conversion helpers
+###########################################################
+
+# Every unit name (eager and lazy) in one flat mapping.  The keys are interned so
+# lookups with literal (or pre-interned) names short-circuit the dict probe on
+# pointer equality instead of hashing and comparing character-by-character.
+_TABLE = {
+    sys.intern(name): float(value)
+    for name, value in [
+        *(
+            (name, value)
+            for name, value in globals().items()
+            if not name.startswith("_") and isinstance(value, (int, float))
+        ),
+        *_LAZY.items(),
+    ]
+}
+
+# Zero-overhead path for callers that hold interned unit names: one dict probe,
+# raising KeyError (not ValueError) on unknown names.
+get_factor = _TABLE.__getitem__
+
+
+def _lookup(name: str) -> float:
+    """Returns the factor for a unit name, covering the lazily resolved aliases."""
+    try:
+        return _TABLE[sys.intern(name)]
+    except KeyError:
+        raise ValueError(f"Unknown unit name: {name!r}") from None
+
+
+@lru_cache(maxsize=512)
+def conversion_factor(from_unit: str, to_unit: str) -> float:
+    """Calculates the multiplicative factor to convert between two units
+
+    The factor for a given ``(from_unit, to_unit)`` pair is computed once and
+    memoized, so hot conversion paths pay a single cache probe instead of two name
+    lookups and a division per call.
+
+    Parameters
+    ----------
+    from_unit : str
+        The name of the unit being converted from (e.g. ``"mile"``).
+    to_unit : str
+        The name of the unit being converted to (e.g. ``"meter"``).  Both units
+        must measure the same quantity — this is not checked.
+
+    Returns
+    -------
+    float
+        The factor by which to multiply a value in `from_unit` to express it in
+        `to_unit`.
+
+    Raises
+    ------
+    ValueError
+        If either name is not a known unit.
+
+    Notes
+    -----
+    Temperature scales other than kelvin/rankine involve an offset and cannot be
+    converted by a bare factor; use
+    ``science_book.units.temperature_conversion`` for those.
+
+    Examples
+    --------
+    >>> conversion_factor("inch", "meter")
+    0.0254
+
+    >>> conversion_factor("hour", "minute")
+    60.0
+    """
+    return _lookup(from_unit) / _lookup(to_unit)
+
+
+def make_converter(from_unit: str, to_unit: str) -> Callable[[float], float]:
+    """Creates a converter function for a fixed pair of units
+
+    The returned closure captures the (memoized) conversion factor, reducing each
+    conversion in an inner loop to one multiply with no name lookups at all.
+
+    Parameters
+    ----------
+    from_unit : str
+        The name of the unit being converted from.
+    to_unit : str
+        The name of the unit being converted to.
+
+    Returns
+    -------
+    collections.abc.Callable
+        A function of one argument that converts a value in `from_unit` to
+        `to_unit`.
+
+    Examples
+    --------
+    >>> hours_to_seconds = make_converter("hour", "second")
+    >>> hours_to_seconds(2)
+    7200.0
+    """
+    factor = conversion_factor(from_unit, to_unit)
+
+    def converter(value: float) -> float:
+        return value * factor
+
+    return converter
@@ -0,0 +1,61 @@
+"""Numba-compiled temperature-conversion kernels for hot loops.
+
+This module is importable only when Numba is installed (the ``jit`` extra).  Each
+kernel fills a caller-provided contiguous float64 output buffer from an input
+buffer of the same length, compiled ahead of first use with an explicit signature
+(no dispatcher type inference per call), ``cache=True`` (no recompile per
+process), ``fastmath`` and a parallel range so LLVM auto-vectorizes the
+multiply-adds across cores.  For one-off or list-based conversions use
+:mod:`science_book.units.temperature_conversion` instead.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+__all__ = [
+    "celsius_to_kelvin",
+    "fahrenheit_to_kelvin",
+    "kelvin_to_celsius",
+    "kelvin_to_fahrenheit",
+    "kelvin_to_rankine",
+    "rankine_to_kelvin",
+]
+
+_SIGNATURE = "void(float64[::1], float64[::1])"
+
+
+@njit(_SIGNATURE, cache=True, fastmath=True, parallel=True)
+def celsius_to_kelvin(values: np.ndarray, out: np.ndarray) -> None:  # pragma: no cover - requires numba
+    for i in prange(values.size):
+        out[i] = values[i] + 273.15
+
+
+@njit(_SIGNATURE, cache=True, fastmath=True, parallel=True)
+def fahrenheit_to_kelvin(values: np.ndarray, out: np.ndarray) -> None:  # pragma: no cover - requires numba
+    for i in prange(values.size):
+        out[i] = ((values[i] - 32.0) * (5.0 / 9.0)) + 273.15
+
+
+@njit(_SIGNATURE, cache=True, fastmath=True, parallel=True)
+def rankine_to_kelvin(values: np.ndarray, out: np.ndarray) -> None:  # pragma: no cover - requires numba
+    for i in prange(values.size):
+        out[i] = values[i] * (5.0 / 9.0)
+
+
+@njit(_SIGNATURE, cache=True, fastmath=True, parallel=True)
+def kelvin_to_celsius(values: np.ndarray, out: np.ndarray) -> None:  # pragma: no cover - requires numba
+    for i in prange(values.size):
+        out[i] = values[i] - 273.15
+
+
+@njit(_SIGNATURE, cache=True, fastmath=True, parallel=True)
+def kelvin_to_fahrenheit(values: np.ndarray, out: np.ndarray) -> None:  # pragma: no cover - requires numba
+    for i in prange(values.size):
+        out[i] = ((values[i] - 273.15) * (9.0 / 5.0)) + 32.0
+
+
+@njit(_SIGNATURE, cache=True, fastmath=True, parallel=True)
+def kelvin_to_rankine(values: np.ndarray, out: np.ndarray) -> None:  # pragma: no cover - requires numba
+    for i in prange(values.size):
+        out[i] = values[i] * (9.0 / 5.0)
@@ -1,4 +1,9 @@
 """
+N.B. The prefixes are stored compactly — one typed array of float values plus a
+tuple of names — and bound into the module namespace lazily (PEP 562) on first
+attribute access.  This keeps the module dict to a handful of entries instead of
+32 separate float slots, and callers never pay for prefixes they do not use.
+
 References
 ----------
 
@@ -9,6 +14,9 @@ References
        New York, NY: Wiley, 2001. ISBN: 9780471320005
 """
 
+from array import array
+
+
 ###########################################################
 # SI Prefixes
 # See: https://en.wikipedia.org/wiki/Metric_prefix
@@ -17,30 +25,24 @@ References
 # N.B.: Using symbols here would clutter the namespace with a lot of single character
 # variable names, so don't do it.
 
-quetta = 1e30
-ronna = 1e27
-yotta = 1e24
-zetta = 1e21
-exa = 1e18
-peta = 1e15
-tera = 1e12
-giga = 1e9
-mega = 1e6
-kilo = 1e3
-hecto = 1e2
-deka = 1e1
-deci = 1e-1
-centi = 1e-2
-milli = 1e-3
-micro = 1e-6
-nano = 1e-9
-pico = 1e-12
-femto = 1e-15
-atto = 1e-18
-zepto = 1e-21
-yocto = 1e-24
-ronto = 1e-27
-quecto = 1e-30
+# fmt: off
+# The grid layout keeps each name over its value; black would explode the
+# magic-trailing-comma tuples one entry per line.
+_SI_NAMES = (
+    "quetta", "ronna", "yotta", "zetta", "exa", "peta", "tera", "giga",
+    "mega", "kilo", "hecto", "deka", "deci", "centi", "milli", "micro",
+    "nano", "pico", "femto", "atto", "zepto", "yocto", "ronto", "quecto",
+)
+
+_SI_VALUES = array(
+    "d",
+    (
+        1e30, 1e27, 1e24, 1e21, 1e18, 1e15, 1e12, 1e9,
+        1e6, 1e3, 1e2, 1e1, 1e-1, 1e-2, 1e-3, 1e-6,
+        1e-9, 1e-12, 1e-15, 1e-18, 1e-21, 1e-24, 1e-27, 1e-30,
+    ),
+)
+# fmt: on
 
 ###########################################################
 # Binary prefixes
@@ -50,11 +52,29 @@ quecto = 1e-30
 # N.B. As stated above, using symbols here would clutter the namespace with a lot of
 # single character variable names, so don't do it.
 
-kibi = 2**10
-mebi = 2**20
-gibi = 2**30
-tebi = 2**40
-pebi = 2**50
-exbi = 2**60
-zebi = 2**70
-yobi = 2**80
+_BINARY_NAMES = ("kibi", "mebi", "gibi", "tebi", "pebi", "exbi", "zebi", "yobi")
+
+# These stay integers (2**10 .. 2**80); yobi exceeds the 64-bit range of a typed
+# array, so a plain tuple holds the group.
+_BINARY_VALUES = (2**10, 2**20, 2**30, 2**40, 2**50, 2**60, 2**70, 2**80)
+
+_INDEX = {name: index for index, name in enumerate(_SI_NAMES + _BINARY_NAMES)}
+
+
+def __getattr__(name: str) -> float:
+    try:
+        index = _INDEX[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    if index < len(_SI_VALUES):
+        value = _SI_VALUES[index]
+    else:
+        value = _BINARY_VALUES[index - len(_SI_VALUES)]
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted([*globals(), *_INDEX])
@@ -0,0 +1,145 @@
+"""A module for converting whole arrays of measurements with NumPy.
+
+Converting element-by-element in a Python loop pays interpreter dispatch per value;
+the helpers here apply one vectorized multiply (plus an add for offset-bearing
+temperature scales) across a contiguous array, so large conversions run at memory
+bandwidth.  Requires NumPy (the ``array`` extra).
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from science_book.units import conversion_factor
+
+
+__all__ = [
+    "convert_array",
+    "convert_temperature_array",
+]
+
+# Affine map (slope, offset) taking each supported scale to kelvin.
+_TO_KELVIN = {
+    "C": (1.0, 273.15),
+    "K": (1.0, 0.0),
+    "F": (5.0 / 9.0, 255.3722222222222),  # (value - 32) * 5/9 + 273.15
+    "R": (5.0 / 9.0, 0.0),
+}
+
+_SCALE_NAMES = {
+    "celsius": "C",
+    "c": "C",
+    "centigrade": "C",
+    "kelvin": "K",
+    "k": "K",
+    "fahrenheit": "F",
+    "f": "F",
+    "rankine": "R",
+    "r": "R",
+}
+
+
+def convert_array(
+    values: "np.ndarray", from_unit: str, to_unit: str, *, out: "Optional[np.ndarray]" = None
+) -> "np.ndarray":
+    """Converts an array of values between two units in one vectorized multiply
+
+    Parameters
+    ----------
+    values : array_like
+        The values (in `from_unit`) that are to be converted.
+    from_unit : str
+        The name of the unit being converted from (e.g. ``"mile"``).
+    to_unit : str
+        The name of the unit being converted to (e.g. ``"meter"``).
+    out : numpy.ndarray, optional
+        A preallocated output array.  Passing the input array converts in place and
+        avoids any allocation.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values expressed in `to_unit`.
+
+    Raises
+    ------
+    ValueError
+        If either name is not a known unit.
+
+    See Also
+    --------
+    science_book.units.conversion_factor
+
+    Examples
+    --------
+    >>> convert_array([0.5, 1.0, 2.0], "hour", "second")
+    array([1800., 3600., 7200.])
+    """
+    factor = conversion_factor(from_unit, to_unit)
+    values = np.asarray(values, dtype=np.float64)
+
+    if out is None:
+        return values * factor
+
+    return np.multiply(values, factor, out=out)
+
+
+def convert_temperature_array(
+    temperatures: "np.ndarray", old_scale: str, new_scale: str, *, out: "Optional[np.ndarray]" = None
+) -> "np.ndarray":
+    """Converts an array of temperatures between scales in one vectorized pass
+
+    Temperature scales convert by an affine (slope and offset) relation rather than
+    a bare factor, so this helper composes the two scale maps into a single
+    multiply-add evaluated into the output buffer without temporaries.
+
+    Parameters
+    ----------
+    temperatures : array_like
+        The temperatures (in `old_scale`) that are to be converted.  Validity (e.g.
+        negative absolute temperature) is not checked.
+    old_scale : str
+        The scale of the input temperatures: celsius ("celsius", "C", "c", or
+        "centigrade"), fahrenheit ("fahrenheit", "F", or "f"), kelvin ("kelvin",
+        "K", or "k"), or rankine ("rankine", "R", or "r").
+    new_scale : str
+        The scale to convert the temperatures to (same spellings as `old_scale`).
+    out : numpy.ndarray, optional
+        A preallocated output array.  Passing the input array converts in place.
+
+    Returns
+    -------
+    numpy.ndarray
+        The temperatures expressed in `new_scale`.
+
+    Raises
+    ------
+    NotImplementedError
+        If either scale name is not supported.
+
+    See Also
+    --------
+    science_book.units.temperature_conversion.convert_temperature
+
+    Examples
+    --------
+    >>> convert_temperature_array([50, 68, 212], "F", "C")
+    array([ 10.,  20., 100.])
+    """
+    try:
+        slope_in, offset_in = _TO_KELVIN[_SCALE_NAMES[old_scale.lower()]]
+        slope_out, offset_out = _TO_KELVIN[_SCALE_NAMES[new_scale.lower()]]
+    except KeyError:
+        raise NotImplementedError("The specified temperature scale is not supported.") from None
+
+    # Compose old -> kelvin -> new into a single affine map.
+    slope = slope_in / slope_out
+    offset = (offset_in - offset_out) / slope_out
+
+    temperatures = np.asarray(temperatures, dtype=np.float64)
+
+    if out is None:
+        out = np.empty_like(temperatures)
+
+    np.multiply(temperatures, slope, out=out)
+    return np.add(out, offset, out=out)
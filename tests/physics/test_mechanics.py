@@ -2,7 +2,7 @@ import math
 
 import pytest
 
-from science_book.physics.mechanics import calculate_freefall_time
+from science_book.physics.mechanics import calculate_freefall_time, simulate_trajectory
 
 
 class TestFreeFall:
@@ -24,3 +24,48 @@ class TestFreeFall:
     def test_zero_gravity_throws(self) -> None:
         with pytest.raises(ValueError):
             time = calculate_freefall_time(20, gravity=0)
+
+
+class TestFreeFallArrays:
+    def test_freefall_accepts_arrays(self) -> None:
+        np = pytest.importorskip("numpy")
+        times = calculate_freefall_time(np.array([0.0, 20.0]))
+        assert times[0] == 0
+        assert math.isclose(times[1], 2.019_619_977_102)
+
+    def test_invalid_height_in_array_throws(self) -> None:
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            calculate_freefall_time(np.array([20.0, -10.0]))
+
+
+class TestSimulateTrajectory:
+    def test_trajectory_matches_scalar_kinematics(self) -> None:
+        np = pytest.importorskip("numpy")
+        displacement, velocity = simulate_trajectory(10, 2, np.array([0.0, 5.0, 10.0, 15.0]))
+        assert displacement.tolist() == [0.0, 75.0, 200.0, 375.0]
+        assert velocity.tolist() == [10.0, 20.0, 30.0, 40.0]
+
+
+class TestJitKernels:
+    def test_jit_kernels_are_reexported(self) -> None:
+        pytest.importorskip("numba")
+        from science_book.physics import mechanics
+        from science_book.physics.mechanics import _jit
+
+        for name in _jit.__all__:
+            assert getattr(mechanics, name) is getattr(_jit, name)
+
+    def test_jit_displacement_matches_pure_python(self) -> None:
+        pytest.importorskip("numba")
+        from science_book.physics.mechanics import _jit
+
+        assert _jit.calculate_displacement(10, 2, 15) == 375.0
+        assert _jit.calculate_velocity(10, 2, 15) == 40.0
+
+    def test_potential_energy_stays_memoized(self) -> None:
+        pytest.importorskip("numba")
+        from science_book.physics.mechanics import calculate_potential_energy
+
+        # The compiled kernels must not replace the lru_cache-wrapped version.
+        assert hasattr(calculate_potential_energy, "cache_info")
@@ -1,5 +1,7 @@
 import math
 
+import pytest
+
 import science_book.units as units
 
 
@@ -8,3 +10,70 @@ class TestMassUnits:
         mass_of_carbon_12 = 12 * units.atomic_mass
         assert math.isclose(mass_of_carbon_12, 1.992_646_879_92e-26)
 
+
+class TestConversionFactors:
+    def test_conversion_factor(self) -> None:
+        assert units.conversion_factor("inch", "meter") == 0.0254
+        assert math.isclose(units.conversion_factor("mile", "foot"), 5280.0)
+
+    def test_unknown_unit_throws(self) -> None:
+        with pytest.raises(ValueError):
+            units.conversion_factor("cubit", "meter")
+
+    def test_make_converter(self) -> None:
+        hours_to_seconds = units.make_converter("hour", "second")
+        assert hours_to_seconds(2) == 7200.0
+
+
+class TestArrayConversion:
+    def test_convert_array(self) -> None:
+        pytest.importorskip("numpy")
+        from science_book.units.array_conversion import convert_array
+
+        assert convert_array([0.5, 1.0, 2.0], "hour", "second").tolist() == [1800.0, 3600.0, 7200.0]
+
+    def test_convert_temperature_array(self) -> None:
+        np = pytest.importorskip("numpy")
+        from science_book.units.array_conversion import convert_temperature_array
+
+        converted = convert_temperature_array([32.0, 212.0], "F", "C")
+        assert np.allclose(converted, [0.0, 100.0])
+
+    def test_convert_temperature_array_in_place(self) -> None:
+        np = pytest.importorskip("numpy")
+        from science_book.units.array_conversion import convert_temperature_array
+
+        temperatures = np.array([0.0, 100.0])
+        result = convert_temperature_array(temperatures, "C", "K", out=temperatures)
+        assert result is temperatures
+        assert temperatures.tolist() == [273.15, 373.15]
+
+
+class TestTemperatureKernels:
+    def test_kernels_round_trip(self) -> None:
+        pytest.importorskip("numba")
+        import numpy as np
+
+        from science_book.units import _kernels
+
+        celsius = np.array([0.0, 100.0])
+        kelvin = np.empty_like(celsius)
+        _kernels.celsius_to_kelvin(celsius, kelvin)
+        assert kelvin.tolist() == [273.15, 373.15]
+
+        back = np.empty_like(kelvin)
+        _kernels.kelvin_to_celsius(kelvin, back)
+        assert np.allclose(back, celsius)
+
+    def test_fahrenheit_kernel_matches_scalar_conversion(self) -> None:
+        pytest.importorskip("numba")
+        import numpy as np
+
+        from science_book.units import _kernels
+        from science_book.units.temperature_conversion import convert_temperature
+
+        fahrenheit = np.array([-40.0, 32.0, 212.0])
+        kelvin = np.empty_like(fahrenheit)
+        _kernels.fahrenheit_to_kelvin(fahrenheit, kelvin)
+        expected = [convert_temperature(value, "F", "K") for value in fahrenheit]
+        assert np.allclose(kelvin, expected)
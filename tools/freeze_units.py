@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Verifies the frozen literals in ``science_book.units._conversion_factors``.
+
+The conversion-factor module stores pre-evaluated literal floats so that importing
+it costs no arithmetic.  This script re-derives every frozen value from first
+principles and exits non-zero (listing the offenders) if any literal in the module
+has drifted from its defining expression.  Run it from CI (or by hand) whenever the
+factors or the physical constants change:
+
+    python tools/freeze_units.py
+"""
+
+import math
+import os
+import sys
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+
+def derive_expected() -> "dict[str, float]":
+    """Re-derives every frozen conversion factor from its defining expression."""
+    expected = {}
+
+    # Time (relative to second)
+    minute = 60.0
+    expected["hour"] = hour = 60 * minute
+    expected["day"] = day = 24 * hour
+    expected["week"] = 7 * day
+    expected["year"] = 365 * day
+    expected["julian_year"] = 365.25 * day
+
+    # Angle (relative to radian)
+    expected["degree"] = degree = math.pi / 180
+    expected["arcmin"] = expected["arcminute"] = arcmin = degree / 60
+    expected["arcsec"] = expected["arcsecond"] = arcsec = arcmin / 60
+
+    # Length (relative to meter)
+    inch = 0.0254
+    expected["foot"] = foot = 12 * inch
+    expected["yard"] = 3 * foot
+    expected["mile"] = mile = 5280 * foot
+    expected["mil"] = inch / 1000
+    au = 149_597_870_700.0
+    expected["parsec"] = au / arcsec
+
+    # Mass (relative to kilogram)
+    pound = 0.453_592_37
+    expected["oz"] = expected["ounce"] = pound / 16
+    expected["stone"] = 14 * pound
+    expected["ton"] = 2000 * pound
+
+    # Pressure (relative to pascal)
+    atm = 101_325
+    expected["torr"] = expected["mmHg"] = atm / 760
+
+    # Volume (relative to meter³)
+    expected["gallon"] = expected["gallon_us"] = gallon = 231 * inch**3
+    gallon_imp = 4.546_09e-3
+    expected["fluid_ounce"] = expected["fluid_ounce_us"] = expected["fluid_oz"] = gallon / 128
+    expected["fluid_ounce_imp"] = gallon_imp / 160
+    expected["bbl"] = expected["barrel"] = 42 * gallon
+
+    # Speed (relative to m/s)
+    expected["kmh"] = 1000.0 / hour
+    expected["mph"] = mile / hour
+    expected["fps"] = foot / 1
+
+    # Temperature (relative to kelvin)
+    expected["degree_fahrenheit"] = 5.0 / 9.0
+
+    # Values frozen from science_book.physics.constants.  Re-deriving them through
+    # the constants module keeps the units package import-independent of the
+    # physics subtree while this check still catches drift between the two.
+    from science_book.physics.constants import (
+        atomic_mass,
+        speed_of_light,
+        standard_gravity,
+    )
+
+    julian_year = 365.25 * day
+    expected["light_year"] = julian_year * speed_of_light
+    expected["g_c"] = g_c = standard_gravity / foot
+    expected["slug"] = g_c * pound
+    expected["psi"] = pound * standard_gravity / inch**2
+    expected["u"] = expected["atomic_mass"] = atomic_mass
+
+    return expected
+
+
+def main() -> int:
+    from science_book.units import _conversion_factors
+
+    drifted = []
+    for name, value in derive_expected().items():
+        frozen = getattr(_conversion_factors, name)
+        if frozen != value:
+            drifted.append(f"  {name}: frozen {frozen!r} != derived {value!r}")
+
+    if drifted:
+        print("Frozen conversion factors have drifted from their defining expressions:")
+        print("\n".join(drifted))
+        return 1
+
+    print("All frozen conversion factors match their defining expressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())